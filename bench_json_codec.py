@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+JSONコーデックのベンチマーク
+telegram-crawler風のレコードを生成し、コーデックごとのパース・シリアライズ性能を計測します
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import List
+
+from jsonl_to_syslog import JSON_CODECS, JsonCodec
+
+
+def generate_records(count: int, seed: int = 0) -> List[dict]:
+    """
+    クローラーの出力に近いレコードを生成
+
+    Args:
+        count: 生成するレコード数
+        seed: 乱数シード（デフォルト: 0）
+
+    Returns:
+        レコード（辞書）のリスト
+    """
+    rng = random.Random(seed)
+    texts = [
+        "本日のアップデート情報をお知らせします。詳細はリンクを参照してください。",
+        "New release is out! Check the changelog for details.",
+        "緊急メンテナンスのお知らせ 🚧 サービスは一時的に利用できません",
+        "Привет всем! Сегодня обсуждаем новые функции.",
+        "価格情報: BTC 📈 +3.2% / ETH 📉 -1.1%",
+    ]
+    records = []
+    for i in range(count):
+        records.append({
+            "channel": f"channel_{rng.randint(1, 500)}",
+            "channel_id": rng.randint(10 ** 9, 10 ** 10),
+            "message_id": i,
+            "date": f"2024-05-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:"
+                    f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}+00:00",
+            "text": rng.choice(texts) * rng.randint(1, 4),
+            "views": rng.randint(0, 100000),
+            "forwards": rng.randint(0, 1000),
+            "reply_to": rng.choice([None, rng.randint(0, i + 1)]),
+            "media": rng.choice([None, {"type": "photo", "size": rng.randint(1000, 10 ** 6)}]),
+            "urls": [f"https://example.com/{rng.randint(0, 10 ** 6)}" for _ in range(rng.randint(0, 3))],
+            "hashtags": rng.sample(["#news", "#crypto", "#ニュース", "#お知らせ", "#release"], rng.randint(0, 3)),
+            # 浮動小数点数（指数表記になる値を含む）と64bitを超える整数
+            "score": rng.choice([rng.random(), 1e20, 1e-7, 123.456, -0.0]),
+            "grouped_id": 123456789012345678901234 if rng.random() < 0.01 else rng.randint(0, 10 ** 6),
+        })
+    return records
+
+
+def benchmark_codec(codec: JsonCodec, lines: List[str], records: List[dict], repeat: int) -> dict:
+    """
+    1つのコーデックのパース・シリアライズ性能を計測
+
+    Args:
+        codec: 計測対象のコーデック（compact=True）
+        lines: パース対象のJSON文字列のリスト（標準ライブラリのcompact形式）
+        records: シリアライズ対象のレコードのリスト
+        repeat: 計測の繰り返し回数（最速の結果を採用）
+
+    Returns:
+        計測結果の辞書（parse_sec, dumps_sec, parse_identical, dumps_identical）
+    """
+    parse_sec = float("inf")
+    dumps_sec = float("inf")
+    # 送信時と同様に、パース時に分かった「浮動小数点数がすべて有限か」をdumpsに渡す
+    finite_flags = [codec.loads_checked(line)[1] for line in lines]
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            codec.loads_checked(line)
+        parse_sec = min(parse_sec, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for record, finite_floats in zip(records, finite_flags):
+            codec.dumps(record, finite_floats=finite_floats)
+        dumps_sec = min(dumps_sec, time.perf_counter() - start)
+
+    # 標準ライブラリとパース結果・シリアライズ結果が同一か確認
+    parse_identical = all(codec.loads(line) == record for record, line in zip(records, lines))
+    dumps_identical = all(
+        codec.dumps(record, finite_floats=finite_floats) == line
+        for record, line, finite_floats in zip(records, lines, finite_flags)
+    )
+    return {
+        "parse_sec": parse_sec,
+        "dumps_sec": dumps_sec,
+        "parse_identical": parse_identical,
+        "dumps_identical": dumps_identical
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONコーデックのベンチマーク")
+    parser.add_argument("--records", type=int, default=100000, help="レコード数（デフォルト: 100000）")
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数（デフォルト: 3）")
+    args = parser.parse_args()
+
+    records = generate_records(args.records)
+    lines = [json.dumps(record, ensure_ascii=False, separators=(",", ":")) for record in records]
+    total_mb = sum(len(line.encode('utf-8')) for line in lines) / (1024 * 1024)
+
+    print(f"レコード数: {len(records)}  データ量: {total_mb:.1f} MiB")
+    print("dumpsは--json-compact相当（区切り文字の空白なし）で計測し、identicalは標準ライブラリとの一致を示します")
+    print(
+        f"{'codec':<10} {'parse rec/s':>12} {'parse MiB/s':>12} {'dumps rec/s':>12} {'dumps MiB/s':>12} "
+        f"{'parse identical':>16} {'dumps identical':>16}"
+    )
+
+    for name in JSON_CODECS:
+        if name == "auto":
+            continue
+        try:
+            codec = JsonCodec(name, compact=True)
+        except ValueError:
+            print(f"{name:<10} (未インストール)")
+            continue
+        result = benchmark_codec(codec, lines, records, args.repeat)
+        print(
+            f"{name:<10} "
+            f"{len(lines) / result['parse_sec']:>12,.0f} {total_mb / result['parse_sec']:>12.1f} "
+            f"{len(records) / result['dumps_sec']:>12,.0f} {total_mb / result['dumps_sec']:>12.1f} "
+            f"{str(result['parse_identical']):>16} {str(result['dumps_identical']):>16}"
+        )
+
+
+if __name__ == "__main__":
+    main()
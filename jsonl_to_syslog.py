@@ -5,70 +5,259 @@ RFC 5424形式のsyslogメッセージを送信します
 """
 
 import argparse
+import array
 import json
+import math
+import multiprocessing
 import os
+import queue
 import socket
 import ssl
 import sys
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple, Union
+
+# 高速なJSONライブラリ（オプション、インストールされている場合のみ使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 # JST (Japan Standard Time) = UTC+9
 JST = timezone(timedelta(hours=9))
 
+# 選択可能なJSONコーデック名
+JSON_CODECS = ("auto", "orjson", "simdjson", "json")
 
-class SyslogSender:
+# orjson/simdjsonでは64bitを超える整数が浮動小数点数に変換されるため、19桁以上の数字の並びを
+# 含む行は標準ライブラリでパースする。数字以外を空白に置き換えてから検索する（正規表現より高速）
+DIGITS_TABLE = bytes(0x30 if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+LONG_DIGITS = b"0" * 19
+
+# RFC 5424 metaのsequenceIdの最大値（超えた場合は1に戻る）
+MAX_SEQUENCE_ID = 2147483647
+
+# 連番付き送信の終了時に送る集計メッセージの構造化データID
+# （32473はRFC 5612でドキュメント用に予約されたPrivate Enterprise Number）
+SEQUENCE_SUMMARY_SD_ID = "sequenceSummary@32473"
+
+# 選択可能なプロトコル名（null、fileはネットワークに送信しない出力先）
+PROTOCOLS = ("udp", "tcp", "tls", "unix", "unix-stream", "null", "file")
+
+# 改行区切りでメッセージを送信するストリーム型のプロトコル
+STREAM_PROTOCOLS = ("tcp", "tls", "unix-stream")
+
+# リプレイ時、目標時刻の直前はsleepではなくビジーウェイトで待つ（秒）
+REPLAY_SPIN_SECONDS = 0.0005
+
+# 並列送信時のワーカーあたりのバイト範囲数（負荷分散とチェックポイントの粒度のため細かく分割）
+RANGES_PER_WORKER = 4
+
+
+def _has_non_finite_float(obj: Any) -> bool:
     """
-    RFC 5424形式のsyslogメッセージを送信するクラス
+    NaNまたは無限大の浮動小数点数を含むか判定
+
+    Args:
+        obj: 判定するPythonオブジェクト（ネストした辞書・リストも含めて判定）
+
+    Returns:
+        NaNまたは無限大を含む場合はTrue
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
+class JsonCodec:
+    """
+    JSONのパースとシリアライズを行うコーデック
+
+    orjsonやsimdjsonがインストールされている場合はパースにそれらを使用し、
+    インストールされていない場合は標準ライブラリのjsonモジュールにフォールバックします。
+    高速なライブラリが扱えない行（NaN、範囲外の数値、64bitを超える整数など）は
+    標準ライブラリでパースするため、パース結果はどのコーデックでも同じです。
+
+    シリアライズは通常、従来どおり標準ライブラリの形式（json.dumps(obj, ensure_ascii=False)）で行います。
+    compactを有効にした場合のみ区切り文字の空白を省略し、orjsonが利用可能ならorjsonでシリアライズします
+    （この場合、浮動小数点数の指数表記が標準ライブラリと異なることがあります。例: 1e20 と 1e+20）。
+    """
+
+    def __init__(self, name: str = "auto", compact: bool = False):
+        """
+        JsonCodecを初期化
+
+        Args:
+            name: コーデック名（"auto"、"orjson"、"simdjson"、または"json"、デフォルト: auto）
+                  "auto"の場合はorjson、simdjson、jsonの順に利用可能なものを使用
+            compact: 区切り文字の空白を省略したJSONを出力するか（デフォルト: False）
+
+        Raises:
+            ValueError: 不明なコーデック名、またはライブラリがインストールされていない場合
+        """
+        name = name.lower()
+        if name not in JSON_CODECS:
+            raise ValueError(f"不明なJSONコーデックです: {name}")
+
+        if name == "auto":
+            if orjson is not None:
+                name = "orjson"
+            elif simdjson is not None:
+                name = "simdjson"
+            else:
+                name = "json"
+        elif name == "orjson" and orjson is None:
+            raise ValueError("orjsonがインストールされていません")
+        elif name == "simdjson" and simdjson is None:
+            raise ValueError("simdjsonがインストールされていません")
+
+        self.name = name
+        self.compact = compact
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        JSON文字列をパース
+
+        Args:
+            data: JSON文字列（strまたはUTF-8のバイト列）
+
+        Returns:
+            パースしたPythonオブジェクト
+
+        Raises:
+            ValueError: JSONとして不正な場合（json.JSONDecodeErrorを含む）
+        """
+        return self.loads_checked(data)[0]
+
+    def loads_checked(self, data: Union[str, bytes]) -> Tuple[Any, bool]:
+        """
+        JSON文字列をパースし、浮動小数点数がすべて有限であることが分かっているかも返す
+
+        orjsonとsimdjsonはNaN、Infinity、範囲外の数値（1E400など）を受け付けないため、
+        それらでパースできた場合は有限であることが分かります。戻り値のフラグをdumps()の
+        finite_floatsに渡すと、NaN/Infinityの確認を省略できます。
+
+        Args:
+            data: JSON文字列（strまたはUTF-8のバイト列）
+
+        Returns:
+            (パースしたPythonオブジェクト, 浮動小数点数がすべて有限であることが分かっている場合True)
+
+        Raises:
+            ValueError: JSONとして不正な場合（json.JSONDecodeErrorを含む）
+        """
+        if self.name != "json":
+            raw = data if isinstance(data, bytes) else data.encode('utf-8', 'surrogatepass')
+            if LONG_DIGITS not in raw.translate(DIGITS_TABLE):
+                try:
+                    if self.name == "orjson":
+                        return orjson.loads(data), True
+                    return simdjson.loads(data), True
+                except ValueError:
+                    # NaN、1E400、単独のサロゲートなど、高速なライブラリが受け付けない行は
+                    # 標準ライブラリで再度パースする
+                    pass
+        return json.loads(data), False
+
+    def dumps(self, obj: Any, finite_floats: bool = False) -> str:
+        """
+        PythonオブジェクトをJSON文字列に変換
+
+        非ASCII文字（日本語など）はエスケープせずにそのまま出力します。
+
+        Args:
+            obj: 変換するPythonオブジェクト
+            finite_floats: 浮動小数点数がすべて有限であることが分かっているか
+                           （loads_checked()の戻り値、Trueの場合はNaN/Infinityの確認を省略）
+
+        Returns:
+            JSON文字列
+        """
+        if not self.compact:
+            return json.dumps(obj, ensure_ascii=False)
+
+        if self.name == "orjson":
+            try:
+                output = orjson.dumps(obj)
+                # orjsonはNaN/Infinityを黙ってnullに変換するため、その場合は標準ライブラリで変換
+                if finite_floats or b"null" not in output or not _has_non_finite_float(obj):
+                    return output.decode('utf-8')
+            except orjson.JSONEncodeError:
+                # 64bitを超える整数など、orjsonが扱えない値は標準ライブラリで変換
+                pass
+        # simdjsonはパース専用のため、シリアライズは標準ライブラリを使用
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class SocketSink:
+    """
+    ソケット経由でsyslogメッセージを送信する出力先
     
-    UDP、TCP、TLSプロトコルに対応しており、syslogサーバにメッセージを送信します。
+    UDP、TCP、TLS、UNIXドメインソケット（データグラム型/ストリーム型）に対応しています。
     TLS接続時は証明書検証とクライアント認証にも対応しています。
     """
     
     def __init__(
         self,
+        protocol: str = "tcp",
         host: str = "localhost",
         port: int = 5140,
-        protocol: str = "tcp",
-        facility: int = 16,  # local0
-        severity: int = 6,   # informational
-        app_name: str = "jsonl-over-syslog",
-        msgid: str = "-",
+        socket_path: str = "/dev/log",
         ca_cert: Optional[str] = None,
         client_cert: Optional[str] = None,
         client_key: Optional[str] = None,
         verify: bool = True
     ):
         """
-        SyslogSenderを初期化し、syslogサーバへの接続を確立します
+        SocketSinkを初期化し、syslogサーバへの接続を確立します
         
         Args:
+            protocol: プロトコル（"udp"、"tcp"、"tls"、"unix"、または"unix-stream"、デフォルト: tcp）
             host: syslogサーバのホスト名（デフォルト: localhost）
             port: syslogサーバのポート番号（デフォルト: 5140）
-            protocol: プロトコル（"udp"、"tcp"、または"tls"、デフォルト: tcp）
-            facility: syslog facility（0-23、デフォルト: 16 = local0）
-            severity: syslog severity（0-7、デフォルト: 6 = informational）
-            app_name: アプリケーション名（デフォルト: jsonl-over-syslog）
-            msgid: メッセージID（デフォルト: "-"）
+            socket_path: UNIXドメインソケットのパス（unix/unix-stream用、デフォルト: /dev/log）
             ca_cert: CA証明書ファイルのパス（TLS用、オプション）
             client_cert: クライアント証明書ファイルのパス（TLS用、オプション）
             client_key: クライアント秘密鍵ファイルのパス（TLS用、オプション）
             verify: 証明書検証を有効にするか（デフォルト: True）
         """
+        self.protocol = protocol
         self.host = host
         self.port = port
-        self.protocol = protocol.lower()
-        self.facility = facility
-        self.severity = severity
-        self.app_name = app_name
-        self.msgid = msgid
+        self.socket_path = socket_path
         self.ca_cert = ca_cert
         self.client_cert = client_cert
         self.client_key = client_key
         self.verify = verify
         
+        if self.protocol in ("unix", "unix-stream"):
+            self.address = self.socket_path
+        else:
+            self.address = f"{self.host}:{self.port}"
+        
+        self._connect()
+    
+    def _connect(self):
+        """
+        syslogサーバへの接続を確立
+        
+        送信に失敗した場合の再接続にも使用します。
+        
+        Raises:
+            ConnectionError: 接続に失敗した場合
+            ValueError: クライアント証明書と秘密鍵の片方だけが指定されている場合
+        """
         try:
             if self.protocol == "tls":
                 # TLS接続を確立
@@ -105,10 +294,307 @@ class SyslogSender:
             elif self.protocol == "tcp":
                 self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.sock.connect((self.host, self.port))
+            elif self.protocol in ("unix", "unix-stream"):
+                # ローカルのsyslogデーモン（/dev/logなど）に接続
+                if not hasattr(socket, "AF_UNIX"):
+                    raise ValueError("このプラットフォームではUNIXドメインソケットを使用できません")
+                sock_type = socket.SOCK_DGRAM if self.protocol == "unix" else socket.SOCK_STREAM
+                self.sock = socket.socket(socket.AF_UNIX, sock_type)
+                self.sock.connect(self.socket_path)
             else:
                 self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         except (socket.error, ssl.SSLError, OSError) as e:
-            raise ConnectionError(f"syslogサーバへの接続に失敗しました ({self.host}:{self.port}): {e}")
+            raise ConnectionError(f"syslogサーバへの接続に失敗しました ({self.address}): {e}")
+    
+    def _write(self, msg_bytes: bytes):
+        """
+        フレーミング済みのメッセージをソケットに書き込む
+        
+        Args:
+            msg_bytes: 送信するバイト列（ストリーム型の場合は改行を含む）
+        """
+        if self.protocol == "udp":
+            self.sock.sendto(msg_bytes, (self.host, self.port))
+        else:
+            self.sock.sendall(msg_bytes)
+    
+    def write(self, msg_bytes: bytes):
+        """
+        1つのsyslogメッセージを送信
+        
+        ストリーム型（TCP/TLS/unix-stream）の場合は改行を追加します。
+        UDP以外で送信に失敗した場合は、1回だけ再接続して再送します。
+        
+        Args:
+            msg_bytes: RFC 5424形式のsyslogメッセージ
+            
+        Raises:
+            OSError: 送信に失敗した場合
+        """
+        if self.protocol in STREAM_PROTOCOLS:
+            # TCP/TLS/unix-streamの場合は改行を追加（syslog over TCPの一般的な実装）
+            msg_bytes += b"\n"
+        
+        try:
+            self._write(msg_bytes)
+        except (socket.error, OSError):
+            if self.protocol == "udp":
+                raise
+            
+            # 接続が切れた場合（syslogデーモンの再起動など）は再接続して再送
+            self.close()
+            self._connect()
+            self._write(msg_bytes)
+    
+    def flush(self):
+        """
+        何もしない（メッセージはwrite()で即座に送信されるため）
+        """
+    
+    def close(self):
+        """
+        ソケット接続を閉じる
+        """
+        try:
+            self.sock.close()
+        except (OSError, AttributeError):
+            # ソケットが既に閉じられている、または属性エラーの場合は無視
+            pass
+    
+
+
+class NullSink:
+    """
+    メッセージを破棄し、件数とバイト数のみを数える出力先
+    
+    ネットワークを除いた読み込み・パース・整形の処理性能（上限）の計測に使用します。
+    """
+    
+    def __init__(self, report: bool = True, report_file=None):
+        """
+        NullSinkを初期化
+        
+        Args:
+            report: close()時に集計結果を出力するか（デフォルト: True）
+            report_file: 集計結果の出力先（Noneの場合はclose()時点の標準エラー出力）
+        """
+        self.report = report
+        self.report_file = report_file
+        self.messages = 0
+        self.bytes = 0
+        self.first_write: Optional[float] = None
+        self.last_write: Optional[float] = None
+    
+    def write(self, msg_bytes: bytes):
+        """
+        メッセージを破棄して件数とバイト数を数える
+        
+        Args:
+            msg_bytes: RFC 5424形式のsyslogメッセージ
+        """
+        self.last_write = time.monotonic()
+        if self.first_write is None:
+            self.first_write = self.last_write
+        self.messages += 1
+        self.bytes += len(msg_bytes)
+    
+    def flush(self):
+        """
+        何もしない（メッセージは保持しないため）
+        """
+    
+    def close(self):
+        """
+        集計結果（件数、バイト数、スループット）を出力
+        """
+        if not self.report:
+            return
+        elapsed = 0.0
+        if self.first_write is not None:
+            elapsed = self.last_write - self.first_write
+        rate = self.messages / elapsed if elapsed > 0 else 0.0
+        print(
+            f"nullシンク (PID {os.getpid()}): {self.messages}件  {self.bytes}バイト  "
+            f"{elapsed:.3f}秒  {rate:,.0f} msg/s",
+            file=self.report_file if self.report_file is not None else sys.stderr
+        )
+
+
+class FileSink:
+    """
+    syslogメッセージを改行区切りでファイルまたは標準出力に書き込む出力先
+    
+    メッセージをバッファに溜め、buffer_sizeを超えたらまとめて1回で書き込みます。
+    書き込んだファイルは後でまとめて転送したり、syslog_receiver.py --inputで検証したりできます。
+    
+    Note:
+        ファイルは追記モードで開きます。並列送信（--workers）では各ワーカーがバッファ単位
+        （最大でbuffer_size程度、常に行の区切りで終わる）でまとめて追記するため、
+        1回の書き込みが分割されない通常のファイルを指定してください（標準出力やパイプでは行が混ざる可能性があります）。
+        ワーカーは範囲の完了を報告する前にflush()でバッファを書き込みます。
+    """
+    
+    def __init__(self, path: str = "-", buffer_size: int = 1024 * 1024):
+        """
+        FileSinkを初期化し、出力先を開きます
+        
+        Args:
+            path: 出力先のファイルパス（"-"の場合は標準出力、デフォルト: -）
+            buffer_size: まとめて書き込むバイト数（デフォルト: 1MiB）
+            
+        Raises:
+            OSError: ファイルを開けなかった場合
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        
+        if path == "-":
+            sys.stdout.flush()
+            self.file = open(sys.stdout.fileno(), 'ab', buffering=0, closefd=False)
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(path, 'ab', buffering=0)
+    
+    def write(self, msg_bytes: bytes):
+        """
+        メッセージをバッファに追加し、buffer_sizeを超えたら書き込む
+        
+        Args:
+            msg_bytes: RFC 5424形式のsyslogメッセージ
+            
+        Raises:
+            OSError: 書き込みに失敗した場合
+        """
+        self._buffer.append(msg_bytes)
+        self._buffer.append(b"\n")
+        self._buffered += len(msg_bytes) + 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+    
+    def flush(self):
+        """
+        バッファの内容を書き込む
+        
+        Raises:
+            OSError: 書き込みに失敗した場合
+        """
+        if not self._buffer:
+            return
+        data = memoryview(b"".join(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+        # パイプなどでは一部しか書き込まれない場合があるため、すべて書き込むまで繰り返す
+        while data:
+            written = self.file.write(data)
+            data = data[written:]
+    
+    def close(self):
+        """
+        バッファの残りを書き込んでファイルを閉じる
+        """
+        try:
+            self.flush()
+        finally:
+            self.file.close()
+
+
+class SyslogSender:
+    """
+    RFC 5424形式のsyslogメッセージを送信するクラス
+    
+    UDP、TCP、TLSプロトコルに対応しており、syslogサーバにメッセージを送信します。
+    TLS接続時は証明書検証とクライアント認証にも対応しています。
+    ローカルのsyslogデーモン向けにUNIXドメインソケット（データグラム型/ストリーム型）にも対応しています。
+    実際の書き込みは出力先（SocketSink、NullSink、FileSink）が行います。
+    """
+    
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5140,
+        protocol: str = "tcp",
+        facility: int = 16,  # local0
+        severity: int = 6,   # informational
+        app_name: str = "jsonl-over-syslog",
+        msgid: str = "-",
+        ca_cert: Optional[str] = None,
+        client_cert: Optional[str] = None,
+        client_key: Optional[str] = None,
+        verify: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        sequence: bool = False,
+        socket_path: str = "/dev/log",
+        output_path: str = "-",
+        sink=None
+    ):
+        """
+        SyslogSenderを初期化し、syslogサーバへの接続を確立します
+        
+        Args:
+            host: syslogサーバのホスト名（デフォルト: localhost）
+            port: syslogサーバのポート番号（デフォルト: 5140）
+            protocol: プロトコル（"udp"、"tcp"、"tls"、"unix"、"unix-stream"、"null"、または"file"、デフォルト: tcp）
+                      "null"はメッセージを破棄して数えるだけ、"file"はoutput_pathに書き込む
+            facility: syslog facility（0-23、デフォルト: 16 = local0）
+            severity: syslog severity（0-7、デフォルト: 6 = informational）
+            app_name: アプリケーション名（デフォルト: jsonl-over-syslog）
+            msgid: メッセージID（デフォルト: "-"）
+            ca_cert: CA証明書ファイルのパス（TLS用、オプション）
+            client_cert: クライアント証明書ファイルのパス（TLS用、オプション）
+            client_key: クライアント秘密鍵ファイルのパス（TLS用、オプション）
+            verify: 証明書検証を有効にするか（デフォルト: True）
+            json_codec: JSONのシリアライズに使用するコーデック（Noneの場合は自動選択）
+            sequence: 各メッセージに連番（RFC 5424のmeta sequenceId）を付与するか（デフォルト: False）
+            socket_path: UNIXドメインソケットのパス（unix/unix-stream用、デフォルト: /dev/log）
+            output_path: 出力先のファイルパス（file用、"-"の場合は標準出力、デフォルト: -）
+            sink: 使用する出力先（指定した場合はprotocolに関係なくこれを使用）
+        """
+        self.host = host
+        self.port = port
+        self.protocol = protocol.lower()
+        self.facility = facility
+        self.severity = severity
+        self.app_name = app_name
+        self.msgid = msgid
+        self.ca_cert = ca_cert
+        self.client_cert = client_cert
+        self.client_key = client_key
+        self.verify = verify
+        self.json_codec = json_codec if json_codec is not None else JsonCodec()
+        self.sequence = sequence
+        # 次に付与する連番（送信に成功した場合のみ進める）
+        self.sequence_id = 1
+        # 連番付きで送信に成功・失敗したメッセージ数（close()時に集計メッセージとして送信）
+        self.sent = 0
+        self.failed = 0
+        self._closed = False
+        self.socket_path = socket_path
+        self.output_path = output_path
+        
+        if sink is not None:
+            self.sink = sink
+        elif self.protocol not in PROTOCOLS:
+            raise ValueError(f"不明なプロトコルです: {self.protocol}")
+        elif self.protocol == "null":
+            self.sink = NullSink()
+        elif self.protocol == "file":
+            try:
+                self.sink = FileSink(self.output_path)
+            except OSError as e:
+                raise ConnectionError(f"出力先のファイルを開けませんでした ({self.output_path}): {e}")
+        else:
+            self.sink = SocketSink(
+                protocol=self.protocol,
+                host=self.host,
+                port=self.port,
+                socket_path=self.socket_path,
+                ca_cert=self.ca_cert,
+                client_cert=self.client_cert,
+                client_key=self.client_key,
+                verify=self.verify
+            )
     
     def _format_syslog_message(self, message: str, structured_data: Optional[str] = None) -> bytes:
         """
@@ -166,8 +652,10 @@ class SyslogSender:
         """
         syslogメッセージを送信
         
-        RFC 5424形式のsyslogメッセージを生成し、設定されたプロトコル（UDP/TCP/TLS）
-        でsyslogサーバに送信します。
+        RFC 5424形式のsyslogメッセージを生成し、出力先（設定されたプロトコルのソケット、
+        nullシンク、またはファイル）に書き込みます。sequenceが有効な場合は、構造化データの先頭に
+        meta要素（sequenceId）を追加します。
+        UDP以外のソケットで送信に失敗した場合は、1回だけ再接続して再送します。
         
         Args:
             message: 送信するメッセージ本文
@@ -176,20 +664,26 @@ class SyslogSender:
         Raises:
             OSError: 送信に失敗した場合
         """
+        if self.sequence:
+            # RFC 5424 7.3.1: [meta sequenceId="N"]
+            meta = f'meta sequenceId="{self.sequence_id}"'
+            structured_data = f"{meta}][{structured_data}" if structured_data else meta
+        
         msg_bytes = self._format_syslog_message(message, structured_data)
         
         try:
-            if self.protocol in ("tcp", "tls"):
-                # TCP/TLSの場合は改行を追加（syslog over TCPの一般的な実装）
-                msg_bytes += b"\n"
-                self.sock.sendall(msg_bytes)
-            else:
-                # UDPの場合はそのまま送信
-                self.sock.sendto(msg_bytes, (self.host, self.port))
+            self.sink.write(msg_bytes)
         except (socket.error, OSError) as e:
+            if self.sequence:
+                self.failed += 1
             raise OSError(f"syslogメッセージの送信に失敗しました: {e}")
+        
+        if self.sequence:
+            # 受信側で欠落を検出できるよう、送信に成功したメッセージにのみ連番を消費する
+            self.sent += 1
+            self.sequence_id = self.sequence_id % MAX_SEQUENCE_ID + 1
     
-    def send_json(self, json_data: dict, message: Optional[str] = None):
+    def send_json(self, json_data: dict, message: Optional[str] = None, finite_floats: bool = False):
         """
         JSONデータをsyslog経由で送信
         
@@ -199,32 +693,294 @@ class SyslogSender:
         Args:
             json_data: 送信するJSONデータ（辞書形式）
             message: カスタムメッセージ（指定しない場合、json_dataをJSON文字列化したものを使用）
+            finite_floats: json_dataの浮動小数点数がすべて有限であることが分かっているか
+                           （JsonCodec.loads_checked()の戻り値）
         """
         # メッセージ部分にJSON文字列をそのまま入れる（データ破損を防ぐ）
         if message:
             msg = message
         else:
             # JSONを文字列として送信（メッセージ部分）
-            # ensure_ascii=Falseで日本語などの非ASCII文字もそのまま送信
-            msg = json.dumps(json_data, ensure_ascii=False)
+            # 日本語などの非ASCII文字もエスケープせずにそのまま送信
+            msg = self.json_codec.dumps(json_data, finite_floats=finite_floats)
         
         # Structured Dataは使わず、メッセージ部分にJSON文字列をそのまま送信
         # これにより、複雑なJSON構造（ネストしたオブジェクト、配列など）も破損せず送信できる
         self.send(msg, structured_data=None)
     
+    def _send_sequence_summary(self):
+        """
+        連番付き送信の集計メッセージを送信し、標準エラー出力にも表示
+        
+        構造化データ[sequenceSummary@32473 sent="N" failed="M" lastSequenceId="L"]を持つ
+        メッセージを送信します（このメッセージ自体には連番を付与しません）。
+        受信側は最後の連番と比較することで、末尾の欠落も検出できます。
+        nullシンクの場合は、件数が送信数と一致するよう集計メッセージを書き込みません。
+        """
+        # 最後に付与した連番（1件も送信していない場合は0）
+        last_sequence_id = (self.sequence_id - 2) % MAX_SEQUENCE_ID + 1 if self.sent else 0
+        summary = (
+            f'{SEQUENCE_SUMMARY_SD_ID} sent="{self.sent}" failed="{self.failed}" '
+            f'lastSequenceId="{last_sequence_id}"'
+        )
+        try:
+            if not isinstance(self.sink, NullSink):
+                self.sink.write(self._format_syslog_message("sequence summary", summary))
+        except (socket.error, OSError):
+            # 集計メッセージの送信失敗は無視（標準エラー出力には表示する）
+            pass
+        print(
+            f"連番 (PID {os.getpid()}): 送信 {self.sent}件  送信失敗 {self.failed}件  "
+            f"最後のsequenceId {last_sequence_id}",
+            file=sys.stderr
+        )
+    
+    def flush(self):
+        """
+        出力先のバッファに残っているメッセージを書き込む
+        
+        Raises:
+            OSError: 書き込みに失敗した場合
+        """
+        try:
+            self.sink.flush()
+        except (socket.error, OSError) as e:
+            raise OSError(f"syslogメッセージの書き込みに失敗しました: {e}")
+    
     def close(self):
         """
-        ソケット接続を閉じる
+        出力先を閉じる
         
-        syslogサーバへの接続を切断します。使用後は必ずこのメソッドを呼び出してください。
+        syslogサーバへの接続を切断します（ファイルの場合はバッファの残りを書き込みます）。
+        sequenceが有効な場合は、閉じる前に送信数・失敗数・最後の連番を集計メッセージとして送信します。
+        使用後は必ずこのメソッドを呼び出してください。
         """
+        if self._closed:
+            return
+        self._closed = True
+        if self.sequence:
+            self._send_sequence_summary()
         try:
-            self.sock.close()
+            self.sink.close()
         except (OSError, AttributeError):
-            # ソケットが既に閉じられている、または属性エラーの場合は無視
+            # 既に閉じられている、または属性エラーの場合は無視
             pass
 
 
+class ReplayScheduler:
+    """
+    レコードのタイムスタンプに基づいて送信タイミングを再現するスケジューラ
+    
+    最初のレコードを基準に、元のレコード間の時間差を速度倍率で割った時刻に送信します。
+    目標時刻は単調増加クロック（time.monotonic()）上の絶対時刻として計算するため、
+    sleepの誤差が累積しません。送信の完了時刻と目標時刻のずれ（ドリフト）を
+    record_sent()で記録します。
+    """
+    
+    def __init__(self, field: str, speed: float = 1.0):
+        """
+        ReplaySchedulerを初期化
+        
+        Args:
+            field: タイムスタンプを含むフィールド名（"."区切りでネストしたフィールドも指定可能）
+                   ISO 8601形式の文字列、またはUNIX時間（秒）の数値に対応
+            speed: 速度倍率（1.0 = 等速、10.0 = 10倍速、0以下 = 待たずに最速で送信）
+        """
+        self.field_path = field.split(".")
+        self.speed = speed
+        # 基準となるレコードのタイムスタンプと、それを送信した単調増加クロックの時刻
+        self.origin_record_time: Optional[float] = None
+        self.origin_clock: Optional[float] = None
+        self.last_record_time: Optional[float] = None
+        self.scheduled = 0
+        self.missing_timestamp = 0
+        self.drifts = array.array('d')
+        # wait()で待機したレコードの目標時刻（最速モードの場合はNone）と、送信完了の記録待ちか
+        self._pending_target: Optional[float] = None
+        self._pending = False
+    
+    def _get_record_time(self, record: Any) -> Optional[float]:
+        """
+        レコードからタイムスタンプ（UNIX時間、秒）を取り出す
+        
+        Args:
+            record: パース済みのJSONデータ
+            
+        Returns:
+            UNIX時間（秒）、フィールドが存在しないか解釈できない場合
+            （NaN・無限大、日時として表現できない値を含む）はNone
+        """
+        value = record
+        for key in self.field_path:
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        
+        if isinstance(value, bool):
+            return None
+        try:
+            if isinstance(value, (int, float)):
+                timestamp = float(value)
+            elif isinstance(value, str):
+                # Python 3.11未満のfromisoformat()は"Z"に対応していないため置き換える
+                if value.endswith("Z"):
+                    value = value[:-1] + "+00:00"
+                timestamp = datetime.fromisoformat(value).timestamp()
+            else:
+                return None
+            # NaN・無限大や、日時として表現できない値はタイムスタンプなしとして扱う
+            if not math.isfinite(timestamp):
+                return None
+            datetime.fromtimestamp(timestamp, timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+        return timestamp
+    
+    def wait(self, record: Any):
+        """
+        レコードの送信時刻まで待機
+        
+        タイムスタンプがないレコードや、前のレコードより古いタイムスタンプのレコードは、
+        直前のレコードと同じ時刻に送信します。
+        送信後はrecord_sent()を呼び出してください。
+        
+        Args:
+            record: パース済みのJSONデータ
+        """
+        self._pending = False
+        now = time.monotonic()
+        record_time = self._get_record_time(record)
+        if record_time is None:
+            self.missing_timestamp += 1
+            record_time = self.last_record_time
+        elif self.last_record_time is not None and record_time < self.last_record_time:
+            record_time = self.last_record_time
+        
+        if self.speed <= 0:
+            # 最速モードの場合は待たない
+            self._pending_target = None
+            self._pending = True
+            return
+        if record_time is None:
+            # 基準となるタイムスタンプがまだない場合は待たない
+            return
+        
+        if self.origin_record_time is None:
+            self.origin_record_time = record_time
+            self.origin_clock = now
+        self.last_record_time = record_time
+        
+        target = self.origin_clock + (record_time - self.origin_record_time) / self.speed
+        remaining = target - now
+        if remaining > REPLAY_SPIN_SECONDS:
+            time.sleep(remaining - REPLAY_SPIN_SECONDS)
+        while time.monotonic() < target:
+            pass
+        
+        self._pending_target = target
+        self._pending = True
+    
+    def record_sent(self):
+        """
+        直前にwait()で待機したレコードの送信完了を記録
+        
+        送信が完了した時刻と目標時刻のずれをドリフトとして記録します。
+        送信に失敗したレコードについては呼び出さないでください。
+        """
+        if not self._pending:
+            return
+        self._pending = False
+        self.scheduled += 1
+        if self._pending_target is not None:
+            self.drifts.append(time.monotonic() - self._pending_target)
+    
+    def print_report(self, file=sys.stderr):
+        """
+        目標時刻からのずれ（ドリフト）の集計結果を出力
+        
+        Args:
+            file: 出力先（デフォルト: 標準エラー出力）
+        """
+        if self.speed > 0 and self.origin_record_time is None:
+            print(
+                f"警告: リプレイ用のフィールド'{'.'.join(self.field_path)}'を持つレコードがなかったため、"
+                f"待機せずに送信しました",
+                file=file
+            )
+            speed = "タイムスタンプなし"
+        else:
+            speed = f"{self.speed}倍速" if self.speed > 0 else "最速"
+        print(f"リプレイ: {speed}  スケジュール送信数: {self.scheduled}  タイムスタンプなし: {self.missing_timestamp}", file=file)
+        if not self.drifts:
+            return
+        
+        drifts = sorted(self.drifts)
+        mean = sum(drifts) / len(drifts)
+        p50 = drifts[len(drifts) // 2]
+        p99 = drifts[min(len(drifts) - 1, len(drifts) * 99 // 100)]
+        print(
+            f"ドリフト(ms): 平均 {mean * 1000:.3f}  中央値 {p50 * 1000:.3f}  "
+            f"p99 {p99 * 1000:.3f}  最大 {drifts[-1] * 1000:.3f}",
+            file=file
+        )
+
+
+def _send_jsonl_line(
+    sender: SyslogSender,
+    codec: JsonCodec,
+    line: Union[str, bytes],
+    delay: float = 0.0,
+    replay: Optional[ReplayScheduler] = None,
+    ignore_send_errors: bool = True
+):
+    """
+    JSONLの1行をパースしてsyslog経由で送信
+
+    空行とJSONパースエラーは無視します（ログ出力なし）。
+    送信エラーはignore_send_errorsがTrueの場合のみ無視します。
+
+    Args:
+        sender: 送信に使用するSyslogSender
+        codec: パースに使用するJSONコーデック
+        line: JSONLの1行（strまたはUTF-8のバイト列）
+        delay: 送信後の遅延（秒）
+        replay: 送信タイミングを再現するスケジューラ（オプション）
+        ignore_send_errors: 送信エラーを無視して続行するか（デフォルト: True）
+
+    Raises:
+        OSError: ignore_send_errorsがFalseで、送信に失敗した場合
+    """
+    line = line.strip()
+    if not line:
+        return
+    
+    try:
+        # JSONをパース
+        json_data, finite_floats = codec.loads_checked(line)
+        
+        # リプレイモードの場合は元のタイミングまで待機
+        if replay is not None:
+            replay.wait(json_data)
+        
+        # syslog経由で送信
+        sender.send_json(json_data, finite_floats=finite_floats)
+        if replay is not None:
+            replay.record_sent()
+        
+        # 遅延を追加
+        if delay > 0:
+            time.sleep(delay)
+            
+    except ValueError:
+        # JSONパースエラー（json.JSONDecodeErrorを含む）は無視して続行
+        pass
+    except (OSError, ConnectionError) as e:
+        if not ignore_send_errors:
+            raise
+        # 接続エラーや送信エラーは無視して続行（ログ出力なし）
+        pass
+
+
 def send_jsonl_file(
     file_path: str,
     syslog_host: str = "localhost",
@@ -238,16 +994,29 @@ def send_jsonl_file(
     ca_cert: Optional[str] = None,
     client_cert: Optional[str] = None,
     client_key: Optional[str] = None,
-    verify: bool = True
+    verify: bool = True,
+    json_codec: str = "auto",
+    json_compact: bool = False,
+    sequence: bool = False,
+    sender: Optional[SyslogSender] = None,
+    workers: int = 1,
+    checkpoint_file: Optional[str] = None,
+    socket_path: str = "/dev/log",
+    replay: Optional[ReplayScheduler] = None,
+    output_path: str = "-"
 ):
     """
     JSONLファイルを読み込んでsyslog経由で送信
     
+    workersが2以上で通常のファイルの場合は、ファイルを改行位置で揃えたバイト範囲に分割し、
+    複数のワーカープロセスで並列に送信します（send_jsonl_file_parallel()を参照）。
+    リプレイモードでは送信順序と間隔を保つため、並列化しません。
+    
     Args:
         file_path: JSONLファイルのパス（"-"の場合は標準入力）
         syslog_host: syslogサーバのホスト名
         syslog_port: syslogサーバのポート番号
-        protocol: プロトコル（"udp"、"tcp"、または"tls"）
+        protocol: プロトコル（"udp"、"tcp"、"tls"、"unix"、"unix-stream"、"null"、または"file"）
         facility: syslog facility (0-23)
         severity: syslog severity (0-7)
         app_name: アプリケーション名
@@ -257,19 +1026,64 @@ def send_jsonl_file(
         client_cert: クライアント証明書ファイルのパス（TLS用、オプション）
         client_key: クライアント秘密鍵ファイルのパス（TLS用、オプション）
         verify: 証明書検証を有効にするか（デフォルト: True）
+        json_codec: JSONコーデック名（"auto"、"orjson"、"simdjson"、または"json"）
+        json_compact: 区切り文字の空白を省略したJSONを送信するか
+        sequence: 各メッセージに連番（meta sequenceId）を付与するか
+        sender: 使用するSyslogSender（指定した場合は接続関連の引数を無視し、送信後も閉じない）
+        workers: 並列送信するワーカープロセス数（デフォルト: 1 = 並列化しない）
+        checkpoint_file: 並列送信の進捗を記録するチェックポイントファイルのパス（オプション）
+        socket_path: UNIXドメインソケットのパス（unix/unix-stream用）
+        replay: 送信タイミングを再現するスケジューラ（オプション、ドリフトの集計結果を保持）
+        output_path: 出力先のファイルパス（file用、"-"の場合は標準出力）
     """
-    sender = SyslogSender(
-        host=syslog_host,
-        port=syslog_port,
-        protocol=protocol,
-        facility=facility,
-        severity=severity,
-        app_name=app_name,
-        ca_cert=ca_cert,
-        client_cert=client_cert,
-        client_key=client_key,
-        verify=verify
-    )
+    if workers > 1 and sender is None and replay is None and file_path != "-" and Path(file_path).is_file():
+        send_jsonl_file_parallel(
+            file_path=file_path,
+            workers=workers,
+            checkpoint_file=checkpoint_file,
+            delay=delay,
+            json_codec=json_codec,
+            json_compact=json_compact,
+            sender_options={
+                "host": syslog_host,
+                "port": syslog_port,
+                "protocol": protocol,
+                "facility": facility,
+                "severity": severity,
+                "app_name": app_name,
+                "ca_cert": ca_cert,
+                "client_cert": client_cert,
+                "client_key": client_key,
+                "verify": verify,
+                "sequence": sequence,
+                "socket_path": socket_path,
+                "output_path": output_path
+            }
+        )
+        return
+    
+    if sender is not None:
+        codec = sender.json_codec
+        should_close_sender = False
+    else:
+        codec = JsonCodec(json_codec, compact=json_compact)
+        sender = SyslogSender(
+            host=syslog_host,
+            port=syslog_port,
+            protocol=protocol,
+            facility=facility,
+            severity=severity,
+            app_name=app_name,
+            ca_cert=ca_cert,
+            client_cert=client_cert,
+            client_key=client_key,
+            verify=verify,
+            json_codec=codec,
+            sequence=sequence,
+            socket_path=socket_path,
+            output_path=output_path
+        )
+        should_close_sender = True
     
     try:
         # ファイルまたは標準入力から読み込み
@@ -282,35 +1096,291 @@ def send_jsonl_file(
         
         try:
             for line in file_handle:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    # JSONをパース
-                    json_data = json.loads(line)
-                    
-                    # syslog経由で送信
-                    sender.send_json(json_data)
-                    
-                    # 遅延を追加
-                    if delay > 0:
-                        time.sleep(delay)
-                        
-                except json.JSONDecodeError:
-                    # JSONパースエラーは無視して続行
-                    pass
-                except (OSError, ConnectionError) as e:
-                    # 接続エラーや送信エラーは無視して続行（ログ出力なし）
-                    pass
+                _send_jsonl_line(sender, codec, line, delay, replay)
         finally:
             if should_close:
                 file_handle.close()
         
+    finally:
+        if should_close_sender:
+            sender.close()
+
+
+def split_file_ranges(file_path: str, count: int) -> List[Tuple[int, int]]:
+    """
+    ファイルを改行位置で揃えたバイト範囲に分割
+    
+    ファイルサイズをおおよそ均等に分割し、各境界を次の改行の直後に移動します。
+    これにより各範囲は行の途中で切れず、独立してパースできます。
+    
+    Args:
+        file_path: ファイルのパス
+        count: 分割数（行数が少ない場合は実際の範囲数が少なくなることがあります）
+        
+    Returns:
+        (開始オフセット, 終了オフセット)のリスト（終了オフセットは含まない）
+    """
+    size = Path(file_path).stat().st_size
+    if size == 0:
+        return []
+    
+    boundaries = [0]
+    with open(file_path, 'rb') as f:
+        for i in range(1, count):
+            offset = size * i // count
+            if offset <= boundaries[-1]:
+                continue
+            # 直前の1バイトから読むことで、offsetがちょうど行頭の場合もその位置を境界にする
+            f.seek(offset - 1)
+            f.readline()
+            offset = f.tell()
+            if boundaries[-1] < offset < size:
+                boundaries.append(offset)
+    boundaries.append(size)
+    
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def load_range_checkpoint(checkpoint_file: str, file_path: str) -> Optional[dict]:
+    """
+    並列送信のチェックポイントを読み込む
+    
+    チェックポイントが存在し、対象ファイル（パス、サイズ、更新日時）が一致する場合のみ返します。
+    
+    Args:
+        checkpoint_file: チェックポイントファイルのパス
+        file_path: 送信対象のファイルのパス
+        
+    Returns:
+        チェックポイント（"ranges"に各範囲のstart、end、doneを含む辞書）、
+        存在しない、対象ファイルが変更されている、または読み込みに失敗した場合はNone
+    """
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        stat = Path(file_path).stat()
+        if (
+            checkpoint.get("file") == str(Path(file_path).resolve())
+            and checkpoint.get("size") == stat.st_size
+            and checkpoint.get("mtime_ns") == stat.st_mtime_ns
+            and isinstance(checkpoint.get("ranges"), list)
+        ):
+            return checkpoint
+    except (ValueError, OSError, AttributeError):
+        pass
+    
+    return None
+
+
+def save_range_checkpoint(checkpoint_file: str, checkpoint: dict):
+    """
+    並列送信のチェックポイントを保存
+    
+    書き込み途中で中断されても壊れないよう、一時ファイルに書き込んでから置き換えます。
+    
+    Args:
+        checkpoint_file: チェックポイントファイルのパス
+        checkpoint: 保存するチェックポイント
+    """
+    checkpoint_path = Path(checkpoint_file)
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    try:
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, checkpoint_path)
+    except (OSError, IOError):
+        # ファイル書き込みエラーは無視（ログ出力なし）
+        pass
+
+
+def _send_byte_range(sender: SyslogSender, file_path: str, start: int, end: int, delay: float = 0.0):
+    """
+    ファイルの指定したバイト範囲の行を送信
+    
+    JSONパースエラーの行は読み飛ばしますが、送信エラーは呼び出し元に伝えます
+    （失敗した範囲を完了として記録しないため）。
+    
+    Args:
+        sender: 送信に使用するSyslogSender
+        file_path: JSONLファイルのパス
+        start: 開始オフセット（行頭）
+        end: 終了オフセット（行頭またはファイル末尾、含まない）
+        delay: 各行送信間の遅延（秒）
+        
+    Raises:
+        OSError: 送信に失敗した場合
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            _send_jsonl_line(sender, sender.json_codec, line, delay, ignore_send_errors=False)
+
+
+def _range_worker(
+    file_path: str,
+    sender_options: dict,
+    json_codec: str,
+    json_compact: bool,
+    delay: float,
+    tasks,
+    results
+):
+    """
+    並列送信のワーカープロセス
+    
+    自身の接続を1つ確立し、タスクキューから受け取ったバイト範囲を順に送信します。
+    完了した範囲の番号（またはエラー）を結果キューに返します。
+    
+    Args:
+        file_path: JSONLファイルのパス
+        sender_options: SyslogSenderに渡す引数
+        json_codec: JSONコーデック名
+        json_compact: 区切り文字の空白を省略したJSONを送信するか
+        delay: 各行送信間の遅延（秒）
+        tasks: (範囲番号, 開始オフセット, 終了オフセット)のキュー（Noneで終了）
+        results: (範囲番号, エラーメッセージ)を返すキュー
+    """
+    try:
+        sender = SyslogSender(json_codec=JsonCodec(json_codec, compact=json_compact), **sender_options)
+    except (OSError, ValueError) as e:
+        results.put((None, str(e)))
+        return
+    
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            index, start, end = task
+            try:
+                _send_byte_range(sender, file_path, start, end, delay)
+                # バッファに残っている出力を書き込んでから完了を報告する
+                sender.flush()
+            except (OSError, ValueError) as e:
+                results.put((index, str(e)))
+                break
+            results.put((index, None))
     finally:
         sender.close()
 
 
+def send_jsonl_file_parallel(
+    file_path: str,
+    workers: int,
+    sender_options: dict,
+    checkpoint_file: Optional[str] = None,
+    delay: float = 0.0,
+    json_codec: str = "auto",
+    json_compact: bool = False
+):
+    """
+    1つのJSONLファイルをバイト範囲に分割し、複数のワーカープロセスで並列に送信
+    
+    各ワーカーはそれぞれsyslogサーバへの接続を持ち、範囲ごとにパース・整形・送信を行います。
+    チェックポイントファイルを指定した場合は範囲の完了ごとに進捗を記録し、
+    中断後の再実行では未完了の範囲のみを送信します（全範囲の完了後に削除）。
+    送信に失敗した範囲は完了として記録せず、チェックポイントも残します。
+    
+    Note:
+        メッセージの送信順序はファイル内の順序と一致しません。
+        中断された範囲は再実行時に先頭から送信されるため、一部が重複する可能性があります。
+    
+    Args:
+        file_path: JSONLファイルのパス（通常のファイルのみ）
+        workers: ワーカープロセス数
+        sender_options: SyslogSenderに渡す引数（host、port、protocolなど）
+        checkpoint_file: チェックポイントファイルのパス（Noneの場合は記録しない）
+        delay: 各行送信間の遅延（秒、ワーカーごと）
+        json_codec: JSONコーデック名（"auto"、"orjson"、"simdjson"、または"json"）
+        json_compact: 区切り文字の空白を省略したJSONを送信するか
+        
+    Raises:
+        ConnectionError: ワーカーの接続または送信に失敗した場合
+    """
+    checkpoint = None
+    if checkpoint_file:
+        checkpoint = load_range_checkpoint(checkpoint_file, file_path)
+    if checkpoint is None:
+        stat = Path(file_path).stat()
+        checkpoint = {
+            "file": str(Path(file_path).resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "ranges": [
+                {"start": start, "end": end, "done": False}
+                for start, end in split_file_ranges(file_path, workers * RANGES_PER_WORKER)
+            ]
+        }
+        if checkpoint_file:
+            # 最初の範囲が完了する前に失敗しても、範囲の分割を再実行時に引き継ぐ
+            save_range_checkpoint(checkpoint_file, checkpoint)
+    
+    ranges = checkpoint["ranges"]
+    pending = [i for i, r in enumerate(ranges) if not r["done"]]
+    if not pending:
+        return
+    
+    tasks = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    for index in pending:
+        tasks.put((index, ranges[index]["start"], ranges[index]["end"]))
+    
+    processes = []
+    for _ in range(min(workers, len(pending))):
+        tasks.put(None)
+        process = multiprocessing.Process(
+            target=_range_worker,
+            args=(file_path, sender_options, json_codec, json_compact, delay, tasks, results),
+            daemon=True
+        )
+        process.start()
+        processes.append(process)
+    
+    completed = False
+    try:
+        remaining = len(pending)
+        while remaining:
+            try:
+                index, error = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(process.is_alive() for process in processes):
+                    continue
+                # 最後のワーカーがタイムアウト直後に結果を返して終了した場合に備え、
+                # キューに結果が残っていない場合のみ異常終了とする（残りはループで順に処理）
+                try:
+                    index, error = results.get_nowait()
+                except queue.Empty:
+                    raise ConnectionError("並列送信のワーカーが異常終了しました")
+            if error is not None:
+                raise ConnectionError(f"並列送信に失敗しました: {error}")
+            
+            ranges[index]["done"] = True
+            remaining -= 1
+            if checkpoint_file:
+                save_range_checkpoint(checkpoint_file, checkpoint)
+        completed = True
+    finally:
+        if completed:
+            for process in processes:
+                process.join()
+        else:
+            for process in processes:
+                process.terminate()
+    
+    # 全範囲の送信が完了したらチェックポイントを削除
+    if checkpoint_file:
+        try:
+            Path(checkpoint_file).unlink()
+        except OSError:
+            pass
+
+
 def get_last_processed_date(state_file: str) -> Optional[datetime]:
     """
     前回処理した日時を状態ファイルから読み込む
@@ -433,7 +1503,13 @@ def send_jsonl_from_directory(
     client_key: Optional[str] = None,
     verify: bool = True,
     state_file: Optional[str] = None,
-    pattern: str = "*.jsonl"
+    pattern: str = "*.jsonl",
+    json_codec: str = "auto",
+    json_compact: bool = False,
+    sequence: bool = False,
+    socket_path: str = "/dev/log",
+    replay: Optional[ReplayScheduler] = None,
+    output_path: str = "-"
 ):
     """
     指定ディレクトリ内のJSONLファイルを日付ベースで処理してsyslog経由で送信
@@ -442,7 +1518,7 @@ def send_jsonl_from_directory(
         directory: ディレクトリのパス
         syslog_host: syslogサーバのホスト名
         syslog_port: syslogサーバのポート番号
-        protocol: プロトコル（"udp"、"tcp"、または"tls"）
+        protocol: プロトコル（"udp"、"tcp"、"tls"、"unix"、"unix-stream"、"null"、または"file"）
         facility: syslog facility (0-23)
         severity: syslog severity (0-7)
         app_name: アプリケーション名
@@ -453,6 +1529,13 @@ def send_jsonl_from_directory(
         verify: 証明書検証を有効にするか（デフォルト: True）
         state_file: 状態ファイルのパス（前回処理日時を記録、Noneの場合は記録しない）
         pattern: ファイル名のパターン（デフォルト: *.jsonl）
+        json_codec: JSONコーデック名（"auto"、"orjson"、"simdjson"、または"json"）
+        json_compact: 区切り文字の空白を省略したJSONを送信するか
+        sequence: 各メッセージに連番（meta sequenceId）を付与するか
+                  （全ファイルで1つの接続を共有するため、連番はファイルをまたいで連続する）
+        socket_path: UNIXドメインソケットのパス（unix/unix-stream用）
+        replay: 送信タイミングを再現するスケジューラ（オプション、ファイルをまたいで時刻を再現）
+        output_path: 出力先のファイルパス（file用、"-"の場合は標準出力）
     """
     # 前回処理日時を読み込む
     last_date = None
@@ -468,34 +1551,47 @@ def send_jsonl_from_directory(
     # 最新の処理日時を記録（処理開始時点）
     latest_date = None
     
-    # 各ファイルを処理
-    for file_path in files:
-        try:
-            # ファイルの作成日時を取得
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            
-            # 最新の日時を更新
-            if latest_date is None or file_mtime > latest_date:
-                latest_date = file_mtime
-            
-            # ファイルを送信
-            send_jsonl_file(
-                file_path=str(file_path),
-                syslog_host=syslog_host,
-                syslog_port=syslog_port,
-                protocol=protocol,
-                facility=facility,
-                severity=severity,
-                app_name=app_name,
-                delay=delay,
-                ca_cert=ca_cert,
-                client_cert=client_cert,
-                client_key=client_key,
-                verify=verify
-            )
-        except (OSError, PermissionError, FileNotFoundError):
-            # ファイルアクセスエラーは無視して続行
-            pass
+    # 全ファイルで1つの接続を共有する
+    sender = SyslogSender(
+        host=syslog_host,
+        port=syslog_port,
+        protocol=protocol,
+        facility=facility,
+        severity=severity,
+        app_name=app_name,
+        ca_cert=ca_cert,
+        client_cert=client_cert,
+        client_key=client_key,
+        verify=verify,
+        json_codec=JsonCodec(json_codec, compact=json_compact),
+        sequence=sequence,
+        socket_path=socket_path,
+        output_path=output_path
+    )
+    
+    try:
+        # 各ファイルを処理
+        for file_path in files:
+            try:
+                # ファイルの作成日時を取得
+                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+                
+                # 最新の日時を更新
+                if latest_date is None or file_mtime > latest_date:
+                    latest_date = file_mtime
+                
+                # ファイルを送信
+                send_jsonl_file(
+                    file_path=str(file_path),
+                    delay=delay,
+                    sender=sender,
+                    replay=replay
+                )
+            except (OSError, PermissionError, FileNotFoundError):
+                # ファイルアクセスエラーは無視して続行
+                pass
+    finally:
+        sender.close()
     
     # 処理完了後、最新の日時を保存
     if state_file and latest_date:
@@ -593,12 +1689,24 @@ def main():
   # UDPプロトコルを使用
   %(prog)s data.jsonl --host logs.example.com --port 5140 --protocol udp
 
+  # 送信せずにRFC 5424形式のメッセージをファイルに書き出す
+  %(prog)s data.jsonl --protocol file --output messages.log
+
+  # ネットワークを除いた読み込み・パース・整形の性能を計測
+  %(prog)s data.jsonl --protocol null
+
+  # ローカルのsyslogデーモン（/dev/log）にUNIXドメインソケットで送信
+  %(prog)s data.jsonl --protocol unix --socket-path /dev/log
+
   # TLSで送信（CA証明書を使用）
   %(prog)s data.jsonl --host logs.example.com --port 6514 --protocol tls --ca-cert ca.crt
 
   # TLSで送信（クライアント証明書も使用）
   %(prog)s data.jsonl --host logs.example.com --port 6514 --protocol tls --ca-cert ca.crt --client-cert client.crt --client-key client.key
 
+  # dateフィールドのタイムスタンプに基づいて、元の間隔を10倍速で再現
+  %(prog)s data.jsonl --replay-field date --replay-speed 10
+
   # 標準入力から読み込み
   cat data.jsonl | %(prog)s -
 
@@ -666,9 +1774,22 @@ def main():
     
     parser.add_argument(
         "--protocol",
-        choices=["udp", "tcp", "tls"],
+        choices=list(PROTOCOLS),
         default=get_env_value("SYSLOG_PROTOCOL", "tcp"),
-        help="プロトコル（デフォルト: tcp、環境変数: SYSLOG_PROTOCOL）"
+        help="プロトコル（unix/unix-streamはローカルのsyslogデーモン用、nullは破棄して件数のみ計測、"
+             "fileは--outputに書き込み、デフォルト: tcp、環境変数: SYSLOG_PROTOCOL）"
+    )
+    
+    parser.add_argument(
+        "--output",
+        default=get_env_value("SYSLOG_OUTPUT", "-"),
+        help="出力先のファイルパス（--protocol file用、'-'の場合は標準出力、追記モード、デフォルト: -、環境変数: SYSLOG_OUTPUT）"
+    )
+    
+    parser.add_argument(
+        "--socket-path",
+        default=get_env_value("SYSLOG_SOCKET_PATH", "/dev/log"),
+        help="UNIXドメインソケットのパス（unix/unix-stream用、デフォルト: /dev/log、環境変数: SYSLOG_SOCKET_PATH）"
     )
     
     parser.add_argument(
@@ -699,7 +1820,7 @@ def main():
         "--delay",
         type=float,
         default=get_float_env("SYSLOG_DELAY", 0.0),
-        help="各行送信間の遅延（秒、デフォルト: 0.0、環境変数: SYSLOG_DELAY）"
+        help="各行送信間の遅延（秒、--workers指定時はワーカーごと、デフォルト: 0.0、環境変数: SYSLOG_DELAY）"
     )
     
     parser.add_argument(
@@ -728,11 +1849,73 @@ def main():
         help="証明書検証を無効化（TLS用、非推奨、環境変数: SYSLOG_NO_VERIFY）"
     )
     
+    # --sequenceのデフォルト値を環境変数から取得
+    sequence_default = get_env_value("SYSLOG_SEQUENCE", "false").lower() == "true"
+    parser.add_argument(
+        "--sequence",
+        action="store_true",
+        help="各メッセージに連番（RFC 5424の[meta sequenceId]）を付与（syslog_receiver.pyで欠落を計測可能、環境変数: SYSLOG_SEQUENCE）"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=get_int_env("SYSLOG_WORKERS", 1),
+        help="1つのファイルをバイト範囲に分割して並列送信するワーカー数（ファイル指定時のみ、--delayはワーカーごとに適用されるため送信レートは約ワーカー数倍、デフォルト: 1、環境変数: SYSLOG_WORKERS）"
+    )
+    
+    parser.add_argument(
+        "--checkpoint-file",
+        default=get_env_value("SYSLOG_CHECKPOINT_FILE"),
+        help="並列送信の進捗を記録するファイル（中断後の再実行で未完了の範囲のみ送信、環境変数: SYSLOG_CHECKPOINT_FILE）"
+    )
+    
+    parser.add_argument(
+        "--replay-field",
+        default=get_env_value("SYSLOG_REPLAY_FIELD"),
+        help="リプレイモード: 指定したタイムスタンプのフィールド（例: date）に基づいて元の送信間隔を再現（環境変数: SYSLOG_REPLAY_FIELD）"
+    )
+    
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=get_float_env("SYSLOG_REPLAY_SPEED", 1.0),
+        help="リプレイの速度倍率（1.0 = 等速、10.0 = 10倍速、0 = 最速、デフォルト: 1.0、環境変数: SYSLOG_REPLAY_SPEED）"
+    )
+    
+    parser.add_argument(
+        "--json-codec",
+        choices=list(JSON_CODECS),
+        default=get_env_value("SYSLOG_JSON_CODEC", "auto"),
+        help="JSONコーデック（auto: orjson、simdjson、jsonの順に自動選択、デフォルト: auto、環境変数: SYSLOG_JSON_CODEC）"
+    )
+    
+    # --json-compactのデフォルト値を環境変数から取得
+    json_compact_default = get_env_value("SYSLOG_JSON_COMPACT", "false").lower() == "true"
+    parser.add_argument(
+        "--json-compact",
+        action="store_true",
+        help="区切り文字の空白を省略したJSONを送信（orjsonがあればシリアライズも高速化、環境変数: SYSLOG_JSON_COMPACT）"
+    )
+    
     args = parser.parse_args()
     
     # --no-verifyが指定されていない場合、環境変数の値を使用
     no_verify = args.no_verify if args.no_verify else no_verify_default
+    sequence = args.sequence if args.sequence else sequence_default
+    json_compact = args.json_compact if args.json_compact else json_compact_default
+
+    # 指定されたJSONコーデックが利用可能か確認
+    try:
+        JsonCodec(args.json_codec)
+    except ValueError as e:
+        parser.error(str(e))
     
+    # リプレイモード
+    replay = None
+    if args.replay_field:
+        replay = ReplayScheduler(args.replay_field, args.replay_speed)
+
     # ディレクトリモード
     if args.dir:
         send_jsonl_from_directory(
@@ -749,7 +1932,13 @@ def main():
             client_key=args.client_key,
             verify=not no_verify,
             state_file=args.state_file,
-            pattern=args.pattern
+            pattern=args.pattern,
+            json_codec=args.json_codec,
+            json_compact=json_compact,
+            sequence=sequence,
+            socket_path=args.socket_path,
+            replay=replay,
+            output_path=args.output
         )
     else:
         # ファイルモード（従来通り）
@@ -769,8 +1958,19 @@ def main():
             ca_cert=args.ca_cert,
             client_cert=args.client_cert,
             client_key=args.client_key,
-            verify=not no_verify
+            verify=not no_verify,
+            json_codec=args.json_codec,
+            json_compact=json_compact,
+            sequence=sequence,
+            workers=args.workers,
+            checkpoint_file=args.checkpoint_file,
+            socket_path=args.socket_path,
+            replay=replay,
+            output_path=args.output
         )
+    
+    if replay is not None:
+        replay.print_report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+jsonl_to_syslog.pyの送信結果を検証するローカルsyslog受信ツール
+--sequenceで付与された連番（RFC 5424の[meta sequenceId]）から欠落・順序入れ替わり・重複を集計します
+"""
+
+import argparse
+import bisect
+import os
+import re
+import selectors
+import socket
+import stat
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 構造化データ内のmeta要素からsequenceIdを取り出す（metaより前の要素も許容）
+META_SEQUENCE_RE = re.compile(rb'^(?:\[[^\]]*\])*?\[meta [^\]]*?\bsequenceId="(\d+)"')
+
+# 送信側が終了時に送る集計メッセージ（jsonl_to_syslog.pyのSEQUENCE_SUMMARY_SD_ID）
+SEQUENCE_SUMMARY_RE = re.compile(
+    rb'^(?:\[[^\]]*\])*?\[sequenceSummary@32473 sent="(\d{1,20})" failed="(\d{1,20})" '
+    rb'lastSequenceId="(\d{1,10})"\]'
+)
+
+# RFC 5424 metaのsequenceIdの最大値（jsonl_to_syslog.pyのMAX_SEQUENCE_IDと同じ）
+MAX_SEQUENCE_ID = 2147483647
+
+# 1回の受信で読み込む最大バイト数
+RECV_SIZE = 65536
+
+
+class SequenceStats:
+    """
+    1つの送信元（HOSTNAME、APP-NAME、PROCID）ごとの連番の集計
+
+    受信済みの連番そのものではなく、最大値より小さい未受信の区間（欠落区間）のみを保持するため、
+    メモリ使用量は連番の大きさではなく欠落の発生回数に比例します。
+    """
+
+    def __init__(self):
+        self.received = 0
+        self.unique = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.lowest: Optional[int] = None
+        self.highest = 0
+        # 送信側の集計メッセージ（送信数、送信失敗数、最後のsequenceId）
+        self.summary: Optional[Tuple[int, int, int]] = None
+        # lowestからhighestまでの欠落区間（開始・終了を含む、開始の昇順）
+        self._gap_starts: List[int] = []
+        self._gap_ends: List[int] = []
+        self._missing = 0
+
+    def _add_gap(self, start: int, end: int):
+        """欠落区間を追加（既存の区間とは重ならないこと）"""
+        index = bisect.bisect_left(self._gap_starts, start)
+        self._gap_starts.insert(index, start)
+        self._gap_ends.insert(index, end)
+        self._missing += end - start + 1
+
+    def add(self, sequence_id: int):
+        """
+        受信した連番を記録
+
+        Args:
+            sequence_id: 受信したメッセージのsequenceId（1以上MAX_SEQUENCE_ID以下）
+        """
+        self.received += 1
+
+        if self.lowest is None:
+            self.lowest = self.highest = sequence_id
+            self.unique += 1
+            return
+
+        if sequence_id > self.highest:
+            if sequence_id > self.highest + 1:
+                self._add_gap(self.highest + 1, sequence_id - 1)
+            self.highest = sequence_id
+            self.unique += 1
+            return
+
+        if sequence_id < self.lowest:
+            # 後続の連番より遅れて到着した（受信済みの最小値より前）
+            if sequence_id < self.lowest - 1:
+                self._add_gap(sequence_id + 1, self.lowest - 1)
+            self.lowest = sequence_id
+            self.unique += 1
+            self.reordered += 1
+            return
+
+        # lowestからhighestの範囲内: 欠落区間に含まれていれば遅れて到着、含まれていなければ重複
+        index = bisect.bisect_right(self._gap_starts, sequence_id) - 1
+        if index < 0 or self._gap_ends[index] < sequence_id:
+            self.duplicates += 1
+            return
+
+        start, end = self._gap_starts[index], self._gap_ends[index]
+        del self._gap_starts[index]
+        del self._gap_ends[index]
+        self._missing -= end - start + 1
+        if start < sequence_id:
+            self._add_gap(start, sequence_id - 1)
+        if sequence_id < end:
+            self._add_gap(sequence_id + 1, end)
+        self.unique += 1
+        self.reordered += 1
+
+    @property
+    def expected_range(self) -> Tuple[int, int]:
+        """
+        受信するはずだった連番の範囲
+
+        送信側の集計メッセージを受信した場合は1から最後のsequenceIdまで、
+        受信していない場合は受信した最小値から最大値までとなります。
+        """
+        if self.summary is not None:
+            return 1, max(self.summary[2], self.highest)
+        if self.lowest is None:
+            return 1, 0
+        return self.lowest, self.highest
+
+    @property
+    def lost(self) -> int:
+        """受信するはずだった範囲で受信できなかった連番の数"""
+        first, last = self.expected_range
+        if self.lowest is None:
+            return last - first + 1
+        return self._missing + (self.lowest - first) + (last - self.highest)
+
+
+class DeliveryReport:
+    """
+    受信したsyslogメッセージを送信元ごとに集計するクラス
+    """
+
+    def __init__(self):
+        self.streams: Dict[Tuple[bytes, bytes, bytes], SequenceStats] = {}
+        self.messages = 0
+        self.bytes = 0
+        self.without_sequence = 0
+        self.malformed = 0
+        self.first_received: Optional[float] = None
+        self.last_received: Optional[float] = None
+
+    def _get_stats(self, key: Tuple[bytes, bytes, bytes]) -> SequenceStats:
+        """送信元の集計を取得（存在しない場合は作成）"""
+        stats = self.streams.get(key)
+        if stats is None:
+            stats = self.streams[key] = SequenceStats()
+        return stats
+
+    def add_message(self, data: bytes):
+        """
+        1つのsyslogメッセージを集計
+
+        Args:
+            data: RFC 5424形式のsyslogメッセージ（改行を含まない）
+        """
+        self.messages += 1
+        self.bytes += len(data)
+        self.last_received = time.monotonic()
+        if self.first_received is None:
+            self.first_received = self.last_received
+
+        # <PRI>VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID STRUCTURED-DATA MSG
+        parts = data.split(b" ", 6)
+        if len(parts) < 7 or not parts[0].startswith(b"<"):
+            self.malformed += 1
+            return
+
+        key = (parts[2], parts[3], parts[4])
+        match = META_SEQUENCE_RE.match(parts[6])
+        if not match:
+            summary = SEQUENCE_SUMMARY_RE.match(parts[6])
+            if summary:
+                self._get_stats(key).summary = (
+                    int(summary.group(1)), int(summary.group(2)), int(summary.group(3))
+                )
+            else:
+                self.without_sequence += 1
+            return
+
+        digits = match.group(1)
+        # 桁数を先に確認し、巨大な数値の変換を避ける
+        if len(digits) > len(str(MAX_SEQUENCE_ID)) or not 1 <= int(digits) <= MAX_SEQUENCE_ID:
+            self.malformed += 1
+            return
+        self._get_stats(key).add(int(digits))
+
+    def print(self, file=sys.stdout):
+        """
+        集計結果を出力
+
+        Args:
+            file: 出力先（デフォルト: 標準出力）
+        """
+        if self.first_received is None:
+            elapsed = 1e-9
+        else:
+            elapsed = max(self.last_received - self.first_received, 1e-9)
+        print(f"受信メッセージ数: {self.messages}  受信バイト数: {self.bytes}", file=file)
+        print(f"受信レート: {self.messages / elapsed:,.0f} msg/s  {self.bytes / elapsed / (1024 * 1024):.2f} MiB/s", file=file)
+        print(f"連番なし: {self.without_sequence}  不正な形式: {self.malformed}", file=file)
+
+        for (hostname, app_name, procid), stats in sorted(self.streams.items()):
+            first, last = stats.expected_range
+            expected = last - first + 1
+            loss_rate = stats.lost / expected * 100 if expected > 0 else 0.0
+            if stats.summary is None:
+                sender_info = "送信側の集計なし（末尾の欠落は検出できません）"
+            else:
+                sender_info = f"送信側: 送信 {stats.summary[0]}  送信失敗 {stats.summary[1]}"
+            print(
+                f"{hostname.decode(errors='replace')} {app_name.decode(errors='replace')} "
+                f"{procid.decode(errors='replace')}: "
+                f"範囲 {first}-{last}  受信 {stats.received}  "
+                f"欠落 {stats.lost} ({loss_rate:.3f}%)  順序入れ替わり {stats.reordered}  重複 {stats.duplicates}  "
+                f"{sender_info}",
+                file=file
+            )
+
+
+def read_file(path: str, report: DeliveryReport):
+    """
+    改行区切りのsyslogメッセージをファイルから読み込んで集計
+
+    Args:
+        path: ファイルのパス（"-"の場合は標準入力）
+        report: 集計先
+    """
+    if path == "-":
+        file_handle = sys.stdin.buffer
+    else:
+        file_handle = open(path, 'rb')
+    try:
+        for line in file_handle:
+            line = line.rstrip(b"\r\n")
+            if line:
+                report.add_message(line)
+    finally:
+        if file_handle is not sys.stdin.buffer:
+            file_handle.close()
+
+
+def serve(
+    report: DeliveryReport,
+    host: str = "0.0.0.0",
+    port: int = 5140,
+    protocol: str = "udp",
+    rcvbuf: Optional[int] = None,
+    duration: Optional[float] = None,
+    idle_timeout: Optional[float] = None,
+    socket_path: Optional[str] = None
+):
+    """
+    UDP、TCP、またはUNIXドメインソケットでsyslogメッセージを受信して集計
+
+    ストリーム型（tcp、unix-stream）の場合は改行区切り（jsonl_to_syslog.pyの送信形式）として扱い、
+    複数の接続を同時に受け付けます。
+
+    Args:
+        report: 集計先
+        host: 待ち受けるアドレス（デフォルト: 0.0.0.0）
+        port: 待ち受けるポート番号（デフォルト: 5140）
+        protocol: プロトコル（"udp"、"tcp"、"unix"、または"unix-stream"、デフォルト: udp）
+        rcvbuf: 受信バッファサイズ（SO_RCVBUF、Noneの場合はOSのデフォルト）
+        duration: 受信を続ける秒数（Noneの場合は無制限）
+        idle_timeout: 最後の受信からこの秒数メッセージがなければ終了（Noneの場合は無制限）
+        socket_path: 待ち受けるUNIXドメインソケットのパス（unix/unix-stream用）
+
+    Raises:
+        FileExistsError: socket_pathにソケット以外のファイルが存在する場合
+
+    Note:
+        socket_pathに残っているソケットファイルは削除してから待ち受けます。
+        終了時には、このプロセスが作成したソケットファイルのみを削除します。
+    """
+    selector = selectors.DefaultSelector()
+    datagram = protocol in ("udp", "unix")
+    sock_type = socket.SOCK_DGRAM if datagram else socket.SOCK_STREAM
+    if protocol in ("unix", "unix-stream"):
+        # 前回の実行で残ったソケットファイルを削除（ソケット以外のファイルは削除しない）
+        try:
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                raise FileExistsError(f"ソケット以外のファイルが存在します: {socket_path}")
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, sock_type)
+        address = socket_path
+    else:
+        listener = socket.socket(socket.AF_INET, sock_type)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        address = (host, port)
+    if rcvbuf:
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    try:
+        listener.bind(address)
+    except OSError:
+        listener.close()
+        raise
+    # bindに成功した場合のみ、終了時にソケットファイルを削除する
+    created_socket = protocol in ("unix", "unix-stream")
+    if not datagram:
+        listener.listen()
+    listener.setblocking(False)
+    selector.register(listener, selectors.EVENT_READ)
+
+    # TCP接続ごとの未処理データ（改行で区切られていない末尾部分）
+    pending: Dict[socket.socket, bytes] = {}
+    deadline = time.monotonic() + duration if duration else None
+
+    try:
+        while True:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+            if idle_timeout and report.last_received is not None and now - report.last_received >= idle_timeout:
+                break
+
+            for key, _ in selector.select(timeout=0.5):
+                sock = key.fileobj
+                if sock is listener and datagram:
+                    # 溜まっているデータグラムをまとめて読む
+                    while True:
+                        try:
+                            data = sock.recv(RECV_SIZE)
+                        except BlockingIOError:
+                            break
+                        report.add_message(data.rstrip(b"\n"))
+                elif sock is listener:
+                    conn, _ = sock.accept()
+                    if rcvbuf:
+                        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+                    conn.setblocking(False)
+                    pending[conn] = b""
+                    selector.register(conn, selectors.EVENT_READ)
+                else:
+                    try:
+                        data = sock.recv(RECV_SIZE)
+                    except BlockingIOError:
+                        continue
+                    except ConnectionResetError:
+                        data = b""
+                    buffer = pending[sock] + data
+                    lines = buffer.split(b"\n")
+                    pending[sock] = lines.pop()
+                    for line in lines:
+                        if line:
+                            report.add_message(line)
+                    if not data:
+                        # 接続が閉じられた
+                        if pending[sock]:
+                            report.add_message(pending[sock])
+                        del pending[sock]
+                        selector.unregister(sock)
+                        sock.close()
+    finally:
+        for conn in pending:
+            conn.close()
+        selector.close()
+        listener.close()
+        if created_socket:
+            try:
+                os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="syslogメッセージを受信し、連番から欠落・順序入れ替わり・重複を集計",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+例:
+  # UDPで受信し、5秒間メッセージが届かなければ集計結果を出力
+  %(prog)s --protocol udp --port 5140 --idle-timeout 5
+
+  # 別の端末から連番付きで送信
+  python3 jsonl_to_syslog.py data.jsonl --protocol udp --port 5140 --sequence
+
+  # ローカルのUNIXドメインソケットで受信
+  %(prog)s --protocol unix --socket-path /tmp/jsonl-over-syslog.sock --idle-timeout 5
+
+  # ファイルに保存されたsyslogメッセージを検証
+  %(prog)s --input messages.log
+        """
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="待ち受けるアドレス（デフォルト: 0.0.0.0）")
+    parser.add_argument("--port", type=int, default=5140, help="待ち受けるポート番号（デフォルト: 5140）")
+    parser.add_argument(
+        "--protocol",
+        choices=["udp", "tcp", "unix", "unix-stream"],
+        default="udp",
+        help="プロトコル（デフォルト: udp）"
+    )
+    parser.add_argument("--socket-path", default="/tmp/jsonl-over-syslog.sock", help="UNIXドメインソケットのパス（unix/unix-stream用、デフォルト: /tmp/jsonl-over-syslog.sock）")
+    parser.add_argument("--rcvbuf", type=int, help="受信バッファサイズ（バイト、SO_RCVBUF）")
+    parser.add_argument("--duration", type=float, help="受信を続ける秒数")
+    parser.add_argument("--idle-timeout", type=float, help="最後の受信からこの秒数メッセージがなければ終了")
+    parser.add_argument("--input", help="ソケットの代わりにファイルから読み込む（'-'の場合は標準入力）")
+    args = parser.parse_args()
+
+    report = DeliveryReport()
+    try:
+        if args.input:
+            read_file(args.input, report)
+        else:
+            serve(
+                report,
+                host=args.host,
+                port=args.port,
+                protocol=args.protocol,
+                rcvbuf=args.rcvbuf,
+                duration=args.duration,
+                idle_timeout=args.idle_timeout,
+                socket_path=args.socket_path
+            )
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as e:
+        parser.error(str(e))
+    report.print()
+
+
+if __name__ == "__main__":
+    main()